@@ -8,6 +8,7 @@ from ... import filters
 from ...constants import VerifiedResult
 from ...core.log import log
 from ...exceptions import InvalidFile
+from ...settings import get_filters
 from ...settings import get_settings
 from ...util.importlib import import_file_as_module
 from .common import valid_path
@@ -202,6 +203,10 @@ def parse_args(args: argparse.Namespace) -> None:
             _raise_if_custom_filter_path_is_invalid(item)
             get_settings().filters[item] = {}
 
+    # Since we modify the filter settings directly (rather than through `configure_filters`),
+    # we need to make sure that the filters are loaded again.
+    get_filters.cache_clear()
+
 
 def _raise_if_custom_filter_path_is_invalid(path: str) -> None:
     """Performs post-validation for custom filters."""
@@ -8,6 +8,7 @@ from typing import Union
 
 from ...core.plugins import Plugin
 from ...plugins.private_key import PrivateKeyDetector
+from ...settings import get_filters
 from ...settings import get_settings
 from ..util import compute_file_hash
 
@@ -53,6 +54,7 @@ def initialize(model_path: Optional[str] = None, limit: float = 3.7) -> None:
 
     path = f'{__name__}.should_exclude_secret'
     get_settings().filters[path] = config
+    get_filters.cache_clear()
 
 
 def should_exclude_secret(secret: str, plugin: Optional[Plugin] = None) -> bool:
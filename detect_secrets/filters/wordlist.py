@@ -7,6 +7,7 @@ use of the Aho-Corasick algorithm.
 from functools import lru_cache
 from typing import Any
 
+from ..settings import get_filters
 from ..settings import get_settings
 from .util import compute_file_hash
 
@@ -52,6 +53,7 @@ def initialize(wordlist_filename: str, min_length: int = 3, file_hash: str = '')
         'file_name': wordlist_filename,
         'file_hash': compute_file_hash(wordlist_filename),
     }
+    get_filters.cache_clear()
 
     automaton.make_automaton()
     return automaton
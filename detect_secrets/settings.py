@@ -1,24 +1,91 @@
+import sys
 from contextlib import contextmanager
-from copy import deepcopy
-from functools import lru_cache
 from importlib import import_module
 from typing import Any
+from typing import Callable
+from typing import cast
 from typing import Dict
+from typing import FrozenSet
 from typing import Generator
 from typing import List
-from urllib.parse import urlparse
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import TypeVar
 
+from .core.log import log
 from .exceptions import InvalidFile
 from .util.importlib import import_file_as_module
-
-
-@lru_cache(maxsize=1)
-def get_settings() -> 'Settings':
+from .util.inject import get_injectable_variables
+
+
+_T = TypeVar('_T', covariant=True)
+
+if TYPE_CHECKING:   # pragma: no cover
+    from typing_extensions import Protocol
+
+    class CachedGetter(Protocol[_T]):
+        """A zero-argument getter, with the same `cache_clear` interface as `lru_cache`."""
+        cache_clear: Callable[[], None]
+
+        def __call__(self) -> _T:
+            ...
+
+
+# These are the filters that are enabled when no other configuration is supplied.
+# NOTE: The first two entries are always run, and hence, are not recorded in the baseline.
+# These are interned, since they are used as dictionary keys very frequently.
+_DEFAULT_FILTER_PATHS: Tuple[str, ...] = tuple(sys.intern(path) for path in (
+    'detect_secrets.filters.common.is_invalid_file',
+    'detect_secrets.filters.heuristic.is_non_text_file',
+    'detect_secrets.filters.allowlist.is_line_allowlisted',
+    'detect_secrets.filters.heuristic.is_sequential_string',
+    'detect_secrets.filters.heuristic.is_potential_uuid',
+    'detect_secrets.filters.heuristic.is_likely_id_string',
+    'detect_secrets.filters.heuristic.is_templated_secret',
+    'detect_secrets.filters.heuristic.is_prefixed_with_dollar_sign',
+    'detect_secrets.filters.heuristic.is_indirect_reference',
+    'detect_secrets.filters.heuristic.is_lock_file',
+    'detect_secrets.filters.heuristic.is_swagger_file',
+))
+_DEFAULT_FILTERS: FrozenSet[str] = frozenset(_DEFAULT_FILTER_PATHS[:2])
+
+# Mapping of filter paths to their resolved (self-aware) functions. Unlike `get_filters`, this
+# survives `cache_bust`, since the function that a path resolves to does not change with settings.
+_filter_fn_cache: Dict[str, Callable] = {}
+
+# NOTE: These are plain module-level singletons (rather than `lru_cache` wrappers), since
+# they are accessed very frequently during scanning. Each getter still exposes `cache_clear`,
+# to remain compatible with the `lru_cache` interface.
+_settings: Optional['Settings'] = None
+_plugins: Optional[List] = None
+_filters: Optional[Tuple] = None
+
+# The plugin configuration that `_plugins` was initialized with. We compare against this (rather
+# than `Settings.plugins`) to decide whether plugins need to be initialized again, since the
+# plugin settings may be modified directly.
+_plugins_config: Dict[str, Dict[str, Any]] = {}
+
+
+def _get_settings() -> 'Settings':
     """
     This is essentially a singleton pattern, that allows for (controlled) global access
     to common variables.
     """
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+
+    return _settings
+
+
+def _clear_settings() -> None:
+    global _settings
+    _settings = None
+
+
+get_settings = cast('CachedGetter[Settings]', _get_settings)
+get_settings.cache_clear = _clear_settings
 
 
 def configure_settings_from_baseline(baseline: Dict[str, Any], filename: str = '') -> 'Settings':
@@ -33,20 +100,22 @@ def configure_settings_from_baseline(baseline: Dict[str, Any], filename: str = '
     if 'filters_used' in baseline:
         settings.configure_filters(baseline['filters_used'])
 
-        if 'detect_secrets.filters.wordlist.should_exclude_secret' in settings.filters:
-            config = settings.filters['detect_secrets.filters.wordlist.should_exclude_secret']
-
+        wordlist_path = 'detect_secrets.filters.wordlist.should_exclude_secret'
+        gibberish_path = 'detect_secrets.filters.gibberish.should_exclude_secret'
+        if wordlist_path in settings.filters or gibberish_path in settings.filters:
+            # We only need to import this if these filters are configured.
             from detect_secrets import filters
+
+        if wordlist_path in settings.filters:
+            config = settings.filters[wordlist_path]
             filters.wordlist.initialize(
                 wordlist_filename=config['file_name'],
                 min_length=config['min_length'],
                 file_hash=config['file_hash'],
             )
 
-        if 'detect_secrets.filters.gibberish.should_exclude_secret' in settings.filters:
-            config = settings.filters['detect_secrets.filters.gibberish.should_exclude_secret']
-
-            from detect_secrets import filters
+        if gibberish_path in settings.filters:
+            config = settings.filters[gibberish_path]
             filters.gibberish.initialize(
                 model_path=config.get('model'),
                 limit=config['limit'],
@@ -56,6 +125,7 @@ def configure_settings_from_baseline(baseline: Dict[str, Any], filename: str = '
         settings.filters['detect_secrets.filters.common.is_baseline_file'] = {
             'filename': filename,
         }
+        get_filters.cache_clear()
 
     return settings
 
@@ -77,14 +147,14 @@ def default_settings() -> Generator['Settings', None, None]:
 @contextmanager
 def transient_settings(config: Dict[str, Any]) -> Generator['Settings', None, None]:
     """Allows the customizability of non-global settings per invocation."""
-    original_settings = get_settings().json()
+    original_settings = get_settings().snapshot()
 
     cache_bust()
     try:
         yield configure_settings_from_baseline(config)
     finally:
         cache_bust()
-        configure_settings_from_baseline(original_settings)
+        get_settings().restore(original_settings)
 
 
 def cache_bust() -> None:
@@ -93,11 +163,17 @@ def cache_bust() -> None:
     get_plugins.cache_clear()
 
 
+def clear_resolved_filters() -> None:
+    """
+    Unlike `cache_bust`, this forces filter paths to be imported again, the next time
+    `get_filters` is called. This is useful when the underlying functions have changed
+    (e.g. through mocking, or an updated custom filter file).
+    """
+    _filter_fn_cache.clear()
+
+
 class Settings:
-    DEFAULT_FILTERS = {
-        'detect_secrets.filters.common.is_invalid_file',
-        'detect_secrets.filters.heuristic.is_non_text_file',
-    }
+    DEFAULT_FILTERS = _DEFAULT_FILTERS
 
     def __init__(self) -> None:
         self.clear()
@@ -109,24 +185,44 @@ class Settings:
         # mapping of python import paths to configuration variables
         self.filters: Dict[str, Dict[str, Any]] = {
             path: {}
-            for path in {
-                *self.DEFAULT_FILTERS,
-                'detect_secrets.filters.allowlist.is_line_allowlisted',
-                'detect_secrets.filters.heuristic.is_sequential_string',
-                'detect_secrets.filters.heuristic.is_potential_uuid',
-                'detect_secrets.filters.heuristic.is_likely_id_string',
-                'detect_secrets.filters.heuristic.is_templated_secret',
-                'detect_secrets.filters.heuristic.is_prefixed_with_dollar_sign',
-                'detect_secrets.filters.heuristic.is_indirect_reference',
-                'detect_secrets.filters.heuristic.is_lock_file',
-                'detect_secrets.filters.heuristic.is_swagger_file',
-            }
+            for path in _DEFAULT_FILTER_PATHS
         }
 
+        # (plugin configuration, initialized plugins, serialized plugins) from the last `json`
+        # call, so that we don't need to initialize every plugin again if nothing has changed.
+        self._plugins_json_cache: Optional[
+            Tuple[Dict[str, Dict[str, Any]], List, List[Dict[str, Any]]]
+        ] = None
+
     def set(self, other: 'Settings') -> None:
         self.plugins = other.plugins
         self.filters = other.filters
 
+    def snapshot(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        This is a cheaper alternative to `json`, for saving the current state: it does not
+        need to initialize every configured plugin.
+        """
+        return (
+            _copy_settings(self.plugins),
+            _copy_settings(self.filters),
+        )
+
+    def restore(
+        self,
+        snapshot: Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]],
+    ) -> None:
+        """
+        :param snapshot: obtained through `Settings.snapshot`. This is copied, so that the
+            same snapshot can be restored multiple times.
+        """
+        plugins, filters = snapshot
+        self.plugins = _copy_settings(plugins)
+        self.filters = _copy_settings(filters)
+
+        get_plugins.cache_clear()
+        get_filters.cache_clear()
+
     def configure_plugins(self, config: List[Dict[str, Any]]) -> 'Settings':
         """
         :param config: e.g.
@@ -136,21 +232,23 @@ class Settings:
             ]
         """
         for plugin in config:
-            plugin = {**plugin}
+            plugin = _copy_config(plugin)
             name = plugin.pop('name')
             self.plugins[name] = plugin
 
-        get_plugins.cache_clear()
+        # Initializing plugins is expensive, so we only want to do it again if we need to.
+        if not _is_same_config(self.plugins, _plugins_config):
+            get_plugins.cache_clear()
+
         return self
 
     def disable_plugins(self, *plugin_names: str) -> 'Settings':
         for name in plugin_names:
-            try:
-                self.plugins.pop(name)
-            except KeyError:
-                pass
+            self.plugins.pop(name, None)
+
+        if not _is_same_config(self.plugins, _plugins_config):
+            get_plugins.cache_clear()
 
-        get_plugins.cache_clear()
         return self
 
     def configure_filters(self, config: List[Dict[str, Any]]) -> 'Settings':
@@ -164,30 +262,69 @@ class Settings:
                 }
             ]
         """
-        self.filters = {
-            path: {}
-            for path in self.DEFAULT_FILTERS
+        filters = {
+            **{path: {} for path in self.DEFAULT_FILTERS},
+
+            # Make a copy, so we don't affect the original.
+            **{
+                sys.intern(filter_config['path']): _copy_config(filter_config)
+                for filter_config in config
+            },
         }
 
-        # Make a copy, so we don't affect the original.
-        filter_configs = deepcopy(config)
-        for filter_config in filter_configs:
-            path = filter_config['path']
-            self.filters[path] = filter_config
+        # If nothing has changed, there's no need to invalidate the filter cache.
+        if not _is_same_config(filters, self.filters):
+            self.filters = filters
+            get_filters.cache_clear()
 
-        get_filters.cache_clear()
         return self
 
     def disable_filters(self, *filter_paths: str) -> 'Settings':
+        has_changed = False
         for filter_path in filter_paths:
-            self.filters.pop(filter_path, None)
+            try:
+                self.filters.pop(filter_path)
+                has_changed = True
+            except KeyError:
+                pass
+
+        if has_changed:
+            get_filters.cache_clear()
 
-        get_filters.cache_clear()
         return self
 
     def json(self) -> Dict[str, Any]:
+        return {
+            'plugins_used': sorted(
+                [_copy_config(plugin) for plugin in self._get_serialized_plugins()],
+                key=lambda x: x['name'].lower(),
+            ),
+            'filters_used': sorted(
+                [
+                    {
+                        'path': path,
+                        **self.filters[path],
+                    }
+                    for path in self.filters.keys() - self.DEFAULT_FILTERS
+                ],
+                key=lambda x: x['path'].lower(),
+            ),
+        }
+
+    def _get_serialized_plugins(self) -> List[Dict[str, Any]]:
+        # NOTE: We compare against a copy of the configuration (rather than relying on
+        # `configure_plugins`) since the plugin settings may be modified directly. The plugins
+        # also need to be the same ones, since they may have been initialized again since.
+        if (
+            self._plugins_json_cache is not None
+            and self._plugins_json_cache[1] is _plugins
+            and _is_same_config(self._plugins_json_cache[0], self.plugins)
+        ):
+            return self._plugins_json_cache[2]
+
+        plugins = get_plugins()
         plugins_used = []
-        for plugin in get_plugins():
+        for plugin in plugins:
             # NOTE: We use the initialized plugin's JSON representation (rather than using
             # the configured settings) to deal with cases where plugins define their own
             # default variables, that is not necessarily carried through through the
@@ -208,27 +345,73 @@ class Settings:
                 **serialized_plugin,
             })
 
-        return {
-            'plugins_used': sorted(
-                plugins_used,
-                key=lambda x: str(x['name'].lower()),
-            ),
-            'filters_used': sorted(
-                [
-                    {
-                        'path': path,
-                        **config,
-                    }
-                    for path, config in self.filters.items()
-                    if path not in self.DEFAULT_FILTERS
-                ],
-                key=lambda x: str(x['path'].lower()),
-            ),
-        }
+        self._plugins_json_cache = (
+            _copy_settings(self.plugins),
+            plugins,
+            plugins_used,
+        )
+        return plugins_used
+
+
+def _copy_settings(settings: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copies plugin or filter settings, including any pattern lists they contain."""
+    return {
+        key: _copy_config(config)
+        for key, config in settings.items()
+    }
+
+
+def _copy_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Plugin and filter configurations are flat mappings (with the exception of lists, such as
+    patterns), so we don't need a full deepcopy.
+    """
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in config.items()
+    }
+
+
+def _is_same_config(a: Any, b: Any) -> bool:
+    """
+    Unlike `==`, this also distinguishes between values like `3` and `3.0`, since
+    they are serialized differently in the baseline.
+    """
+    if type(a) is not type(b):
+        return False
+
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(
+            _is_same_config(value, b[key])
+            for key, value in a.items()
+        )
+
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(_is_same_config, a, b))
+
+    return cast(bool, a == b)
+
+
+def _get_plugins() -> List:
+    global _plugins
+    global _plugins_config
+    if _plugins is None:
+        _plugins_config = _copy_settings(get_settings().plugins)
+        _plugins = _initialize_plugins()
+
+    return _plugins
 
 
-@lru_cache(maxsize=1)
-def get_plugins() -> List:
+def _clear_plugins() -> None:
+    global _plugins
+    _plugins = None
+
+
+get_plugins = cast('CachedGetter[List]', _get_plugins)
+get_plugins.cache_clear = _clear_plugins
+
+
+def _initialize_plugins() -> List:
     # We need to import this here, otherwise it will result in a circular dependency.
     from .core import plugins
 
@@ -238,23 +421,33 @@ def get_plugins() -> List:
     ]
 
 
-@lru_cache(maxsize=1)
-def get_filters() -> List:
-    from .core.log import log
-    from .util.inject import get_injectable_variables
+def _get_filters() -> Tuple:
+    global _filters
+    if _filters is None:
+        _filters = _initialize_filters()
+
+    return _filters
+
+
+def _clear_filters() -> None:
+    global _filters
+    _filters = None
 
+
+get_filters = cast('CachedGetter[Tuple]', _get_filters)
+get_filters.cache_clear = _clear_filters
+
+
+def _initialize_filters() -> Tuple:
     output = []
     for path, config in get_settings().filters.items():
-        parts = urlparse(path)
-        if not parts.scheme:
-            module_path, function_name = path.rsplit('.', 1)
-            try:
-                function = getattr(import_module(module_path), function_name)
-            except (ModuleNotFoundError, AttributeError):
-                log.warning(f'Invalid filter: {path}')
-                continue
+        function = _filter_fn_cache.get(path)
+        if function is not None:
+            output.append(function)
+            continue
 
-        elif parts.scheme == 'file':
+        # NOTE: This is a cheaper alternative to `urlparse`, since we only support one scheme.
+        if path.startswith('file://'):
             file_path, function_name = path[len('file://'):].split('::')
 
             try:
@@ -263,16 +456,27 @@ def get_filters() -> List:
                 log.warning(f'Invalid filter: {path}')
                 continue
 
-        else:
+        elif '://' in path:
             log.warning(f'Invalid filter: {path}')
             continue
 
+        else:
+            module_path, function_name = path.rsplit('.', 1)
+            try:
+                function = getattr(import_module(module_path), function_name)
+            except (ModuleNotFoundError, AttributeError):
+                log.warning(f'Invalid filter: {path}')
+                continue
+
         # We attach this metadata to the function itself, so that we don't need to
         # compute it everytime. This will allow for dependency injection for filters.
-        function.injectable_variables = set(get_injectable_variables(function))
+        function.injectable_variables = frozenset(get_injectable_variables(function))
         output.append(function)
 
         # This is for better logging.
         function.path = path
 
-    return output
+        _filter_fn_cache[path] = function
+
+    # NOTE: This is immutable, so that callers can safely hold onto it.
+    return tuple(output)
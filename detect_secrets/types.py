@@ -1,9 +1,9 @@
 from io import TextIOBase
 from typing import Any
+from typing import FrozenSet
 from typing import NamedTuple
 from typing import NoReturn
 from typing import Optional
-from typing import Set
 
 from .core.potential_secret import PotentialSecret
 from .exceptions import SecretNotFoundOnSpecifiedLineError
@@ -37,7 +37,7 @@ class SelfAwareCallable:
     path: str
 
     # The variable names for its inputs
-    injectable_variables: Set[str]
+    injectable_variables: FrozenSet[str]
 
     def __call__(self, *args: Any, **kwargs: Any) -> NoReturn:
         """
@@ -51,7 +51,7 @@ def make_function_self_aware(func: Callable) -> SelfAwareCallable:
     if inspect.ismethod(func):
         klass = func.__self__.__class__     # type: ignore
         function = getattr(klass, func.__name__)
-        function.injectable_variables = set(get_injectable_variables(func))
+        function.injectable_variables = frozenset(get_injectable_variables(func))
 
         function.path = f'{klass}.{func.__name__}'
     else:
@@ -22,6 +22,7 @@ def clear_cache():
 
     settings.get_settings().clear()
     settings.cache_bust()
+    settings.clear_resolved_filters()
 
     # This is probably too aggressive, but it saves us from remembering to do this every
     # time we add a filter.
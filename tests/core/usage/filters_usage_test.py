@@ -1,5 +1,6 @@
 import tempfile
 import uuid
+from unittest import mock
 
 import pytest
 
@@ -8,6 +9,7 @@ from detect_secrets.core import baseline
 from detect_secrets.core.secrets_collection import SecretsCollection
 from detect_secrets.core.usage import ParserBuilder
 from detect_secrets.settings import default_settings
+from detect_secrets.settings import get_filters
 from detect_secrets.settings import get_settings
 from detect_secrets.settings import transient_settings
 
@@ -165,6 +167,24 @@ def test_disable_filter(parser):
             assert secrets
 
 
+def test_filters_modified_directly_are_loaded(parser):
+    # Initializing the gibberish filter would also reload the filters, so we disable it.
+    with default_settings(), mock.patch(
+        'detect_secrets.filters.gibberish.is_feature_enabled',
+        return_value=False,
+    ):
+        # Load the filters beforehand, to make sure they are not stale after parsing.
+        get_filters()
+
+        # `--no-verify` disables a filter that isn't enabled, so nothing is removed.
+        parser.parse_args(['scan', '--exclude-lines', '^foo', '--no-verify'])
+
+        assert 'detect_secrets.filters.regex.should_exclude_line' in {
+            filter_fn.path
+            for filter_fn in get_filters()
+        }
+
+
 @pytest.fixture
 def parser():
     return ParserBuilder().add_console_use_arguments()
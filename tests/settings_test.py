@@ -0,0 +1,275 @@
+import json
+from unittest import mock
+
+import pytest
+
+from detect_secrets import settings
+from detect_secrets.filters import heuristic
+from detect_secrets.settings import configure_settings_from_baseline
+from detect_secrets.settings import get_filters
+from detect_secrets.settings import get_plugins
+from detect_secrets.settings import get_settings
+from detect_secrets.settings import transient_settings
+
+
+def test_filter_functions_are_not_reimported_after_cache_bust():
+    with transient_settings({
+        'filters_used': [{
+            'path': 'detect_secrets.filters.heuristic.is_sequential_string',
+        }],
+    }):
+        original_filters = get_filters()
+
+    with mock.patch('detect_secrets.settings.import_module') as m, transient_settings({
+        'filters_used': [{
+            'path': 'detect_secrets.filters.heuristic.is_sequential_string',
+        }],
+    }):
+        assert get_filters() == original_filters
+        assert not m.called
+
+    assert settings._filter_fn_cache
+
+
+def test_injectable_variables_are_not_recomputed_after_cache_bust():
+    config = {
+        'filters_used': [{
+            'path': 'detect_secrets.filters.heuristic.is_sequential_string',
+        }],
+    }
+    with transient_settings(config):
+        get_filters()
+
+    with mock.patch(
+        'detect_secrets.settings.get_injectable_variables',
+    ) as m, transient_settings(config):
+        for filter_fn in get_filters():
+            assert filter_fn.injectable_variables
+
+        assert not m.called
+
+
+def test_clear_resolved_filters():
+    config = {
+        'filters_used': [{
+            'path': 'detect_secrets.filters.heuristic.is_sequential_string',
+        }],
+    }
+    with transient_settings(config):
+        get_filters()
+
+    def mock_filter(secret: str) -> bool:
+        return False
+
+    with mock.patch.object(heuristic, 'is_sequential_string', mock_filter):
+        with transient_settings(config):
+            assert mock_filter not in get_filters()
+
+        settings.clear_resolved_filters()
+        with transient_settings(config):
+            assert mock_filter in get_filters()
+
+
+def test_configure_filters_does_not_affect_original_config():
+    config = [{
+        'path': 'detect_secrets.filters.regex.should_exclude_line',
+        'pattern': ['^foo'],
+    }]
+
+    with transient_settings({'filters_used': config}) as config_settings:
+        filter_config = config_settings.filters['detect_secrets.filters.regex.should_exclude_line']
+        filter_config['pattern'].append('^bar')
+
+    assert config[0]['pattern'] == ['^foo']
+
+
+def test_transient_settings_restores_original_settings():
+    get_settings().configure_plugins([{'name': 'AWSKeyDetector'}])
+    get_settings().disable_filters('detect_secrets.filters.common.is_invalid_file')
+    original_plugins = {**get_settings().plugins}
+    original_filters = {**get_settings().filters}
+
+    with mock.patch('detect_secrets.settings.get_plugins') as m, transient_settings({
+        'plugins_used': [{'name': 'BasicAuthDetector'}],
+    }):
+        assert list(get_settings().plugins) == ['BasicAuthDetector']
+
+    # Snapshotting should not require initializing the plugins.
+    assert not m.called
+
+    assert get_settings().plugins == original_plugins
+    assert get_settings().filters == original_filters
+
+
+def test_transient_settings_keeps_disabled_default_filters_disabled():
+    get_settings().disable_filters('detect_secrets.filters.common.is_invalid_file')
+
+    with transient_settings({'filters_used': []}) as config_settings:
+        assert 'detect_secrets.filters.common.is_invalid_file' in config_settings.filters
+
+    assert 'detect_secrets.filters.common.is_invalid_file' not in get_settings().filters
+
+
+class TestJSON:
+    @staticmethod
+    def test_plugins_are_not_reinitialized_if_unchanged():
+        config_settings = get_settings().configure_plugins([{'name': 'AWSKeyDetector'}])
+        expected = config_settings.json()
+
+        config_settings.json()['plugins_used'][0]['name'] = 'foobar'
+        with mock.patch('detect_secrets.settings.get_plugins') as m:
+            assert config_settings.json() == expected
+
+        assert not m.called
+
+    @staticmethod
+    def test_plugin_settings_modified_directly():
+        config_settings = get_settings().configure_plugins([
+            {'name': 'Base64HighEntropyString', 'limit': 4.5},
+        ])
+        config_settings.json()
+
+        config_settings.plugins['Base64HighEntropyString']['limit'] = 3
+        config_settings.json()
+
+        get_plugins.cache_clear()
+
+        assert config_settings.json()['plugins_used'] == [
+            {'name': 'Base64HighEntropyString', 'limit': 3},
+        ]
+
+
+class TestConfigureFilters:
+    @staticmethod
+    @pytest.mark.parametrize(
+        'config',
+        (
+            [],
+            [{'path': 'detect_secrets.filters.heuristic.is_sequential_string'}],
+        ),
+    )
+    def test_unchanged_filters_do_not_invalidate_cache(config):
+        get_settings().configure_filters(config)
+        filters = get_filters()
+
+        get_settings().configure_filters(config)
+        assert get_filters() is filters
+
+    @staticmethod
+    def test_baseline_filename_is_filtered_after_unchanged_configuration():
+        get_settings().configure_filters([])
+        get_filters()
+
+        configure_settings_from_baseline({'filters_used': []}, filename='.secrets.baseline')
+        assert 'detect_secrets.filters.common.is_baseline_file' in {
+            filter_fn.path
+            for filter_fn in get_filters()
+        }
+
+    @staticmethod
+    def test_changed_filters_invalidate_cache():
+        get_settings().configure_filters([])
+        filters = get_filters()
+
+        get_settings().configure_filters([
+            {'path': 'detect_secrets.filters.heuristic.is_sequential_string'},
+        ])
+        assert get_filters() is not filters
+
+
+@pytest.mark.parametrize(
+    'disable_function, getter',
+    (
+        ('disable_plugins', get_plugins),
+        ('disable_filters', get_filters),
+    ),
+)
+def test_disabling_nonexistent_entries_does_not_invalidate_cache(disable_function, getter):
+    get_settings().configure_plugins([{'name': 'AWSKeyDetector'}])
+    output = getter()
+
+    getattr(get_settings(), disable_function)('does_not_exist')
+    assert getter() is output
+
+
+class TestConfigurePlugins:
+    @staticmethod
+    def test_unchanged_plugins_do_not_invalidate_cache():
+        get_settings().configure_plugins([{'name': 'Base64HighEntropyString', 'limit': 4.5}])
+        plugins = get_plugins()
+
+        get_settings().configure_plugins([{'name': 'Base64HighEntropyString', 'limit': 4.5}])
+        assert get_plugins() is plugins
+
+    @staticmethod
+    def test_changed_plugins_invalidate_cache():
+        get_settings().configure_plugins([{'name': 'Base64HighEntropyString', 'limit': 4.5}])
+        plugins = get_plugins()
+
+        get_settings().configure_plugins([{'name': 'Base64HighEntropyString', 'limit': 3}])
+        assert get_plugins() is not plugins
+        assert get_plugins()[0].entropy_limit == 3
+
+    @staticmethod
+    def test_plugin_settings_modified_directly():
+        get_settings().configure_plugins([{'name': 'Base64HighEntropyString', 'limit': 4.5}])
+        get_plugins()
+
+        get_settings().plugins['Base64HighEntropyString']['limit'] = 3.0
+        get_settings().configure_plugins([{'name': 'Base64HighEntropyString', 'limit': 3.0}])
+        assert get_plugins()[0].entropy_limit == 3.0
+
+    @staticmethod
+    def test_list_settings_modified_directly():
+        with mock.patch('detect_secrets.settings._initialize_plugins') as m:
+            get_settings().configure_plugins([{'name': 'CustomPlugin', 'values': ['a']}])
+            get_plugins()
+
+            get_settings().plugins['CustomPlugin']['values'].append('b')
+            get_settings().configure_plugins([{'name': 'CustomPlugin', 'values': ['a', 'b']}])
+            get_plugins()
+
+        assert m.call_count == 2
+
+    @staticmethod
+    def test_equal_values_with_different_types_are_still_applied():
+        get_settings().configure_plugins([{'name': 'HexHighEntropyString', 'limit': 3}])
+        get_plugins()
+
+        get_settings().configure_plugins([{'name': 'HexHighEntropyString', 'limit': 3.0}])
+        assert json.dumps(get_settings().json()['plugins_used']) == json.dumps([
+            {'name': 'HexHighEntropyString', 'limit': 3.0},
+        ])
+
+
+def test_snapshot_and_restore():
+    config_settings = get_settings().configure_plugins([{'name': 'AWSKeyDetector'}])
+    snapshot = config_settings.snapshot()
+    expected = config_settings.json()
+
+    config_settings.configure_plugins([{'name': 'BasicAuthDetector'}])
+    config_settings.configure_filters([
+        {'path': 'detect_secrets.filters.heuristic.is_sequential_string'},
+    ])
+    assert config_settings.json() != expected
+
+    config_settings.restore(snapshot)
+    assert config_settings.json() == expected
+
+
+def test_snapshot_can_be_restored_multiple_times():
+    filter_path = 'detect_secrets.filters.regex.should_exclude_line'
+    config_settings = get_settings().configure_filters([{
+        'path': filter_path,
+        'pattern': ['^foo'],
+    }])
+    snapshot = config_settings.snapshot()
+    expected = json.dumps(config_settings.json())
+
+    config_settings.filters[filter_path]['pattern'].append('^bar')
+    config_settings.restore(snapshot)
+    assert json.dumps(config_settings.json()) == expected
+
+    config_settings.filters[filter_path]['pattern'].append('^bar')
+    config_settings.restore(snapshot)
+    assert json.dumps(config_settings.json()) == expected